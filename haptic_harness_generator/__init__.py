@@ -13,14 +13,33 @@ Example usage:
     generator.regen()
 """
 
-from .main import run_app
-from .core.generator import Generator
+import importlib
+
 from .core.config_manager import ConfigurationManager
 from .core.validation_engine import ValidationEngine
-from .ui.main_window import MyMainWindow as MainWindow
+
+_LAZY_ATTRS = {
+    'run_app': ('.main', 'run_app'),
+    'Generator': ('.core.generator', 'Generator'),
+    'MainWindow': ('.ui.main_window', 'MyMainWindow'),
+}
 
 __version__ = "0.0.42"
 __all__ = ['run_app', 'Generator', 'ConfigurationManager', 'ValidationEngine', 'MainWindow']
 
+
+def __getattr__(name):
+    # run_app, Generator and MainWindow pull in Qt, VTK and pyvista; import
+    # them on first access so ConfigurationManager users skip that cost
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
 if __name__ == "__main__":
+    from .main import run_app
     run_app()
@@ -7,8 +7,25 @@ This module contains the core business logic including:
 - ValidationEngine: Parameter validation
 """
 
-from .generator import Generator
+import importlib
+
 from .config_manager import ConfigurationManager
 from .validation_engine import ValidationEngine
 
+_LAZY_ATTRS = {
+    'Generator': ('.generator', 'Generator'),
+}
+
 __all__ = ['Generator', 'ConfigurationManager', 'ValidationEngine']
+
+
+def __getattr__(name):
+    # generator.py loads VTK, pyvista and PyQt5 at import time; defer it so
+    # the config and validation modules stay importable without them
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
@@ -715,6 +715,19 @@ class ConfigurationManager:
 
         return errors, params
 
+    @staticmethod
+    def _write_json(data: Dict, filepath: str) -> None:
+        """Write data as JSON beside filepath, then move it into place atomically"""
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     @classmethod
     def export_config(cls, config: Dict, filepath: str) -> bool:
         """Export configuration with metadata"""
@@ -727,8 +740,7 @@ class ConfigurationManager:
             },
         }
         try:
-            with open(filepath, "w") as f:
-                json.dump(export_data, f, indent=4)
+            cls._write_json(export_data, filepath)
             return True
         except Exception as e:
             print(f"Export failed: {e}")
@@ -783,12 +795,10 @@ class ConfigurationManager:
 
         try:
             # Save timestamped version to _autosave subdirectory
-            with open(timestamped_filepath, "w") as f:
-                json.dump(export_data, f, indent=4)
+            cls._write_json(export_data, timestamped_filepath)
 
             # Save as latest config.json in main directory
-            with open(latest_filepath, "w") as f:
-                json.dump(export_data, f, indent=4)
+            cls._write_json(export_data, latest_filepath)
 
             print(f"Configuration auto-saved to: {timestamped_filepath}")
             print(f"Latest configuration saved to: {latest_filepath}")
@@ -13,6 +13,7 @@ Example usage:
     generator.regen()  # Generate with default parameters
 """
 
+import logging
 from logging import currentframe
 from PyQt5.QtCore import ws
 from ezdxf.layouts import base
@@ -24,25 +25,69 @@ import numpy as np
 import pyvista as pv
 import ezdxf
 from time import monotonic, perf_counter
-from PyQt5.QtCore import QRunnable, pyqtSignal, QObject
+from PyQt5.QtCore import QRunnable, pyqtSignal, pyqtSlot, QObject, Qt
 from vtkbool.vtkBool import vtkPolyDataBooleanFilter
 
+logger = logging.getLogger(__name__)
+
 
 class Signals(QObject):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
 
 
-class WorkerWrapper(QRunnable):
+class WorkerWrapper(QObject):
+    """Long-lived worker; move it to a QThread and emit run_requested to generate"""
+
+    run_requested = pyqtSignal()
+
     def __init__(self, worker):
         super().__init__()
         self.worker = worker
+        # Queued so run() executes in whichever thread this object lives in
+        self.run_requested.connect(self.run, Qt.QueuedConnection)
 
+    @pyqtSlot()
     def run(self):
         self.worker.run()
 
 
 class Generator(QRunnable):
+    # Parameters that must be positive and non-zero; fixed, so built once
+    VALIDATABLE_PARAMS = frozenset(
+        [
+            "concentricPolygonDiameter",
+            "tactorDiameter",
+            "numSides",
+            "slotWidth",
+            "slotHeight",
+            "slotBorderRadius",
+            "magnetDiameter",
+            "magnetThickness",
+            "magnetRingDiameter",
+            "numMagnetsInRing",
+            "magnetClipThickness",
+            "magnetClipRingThickness",
+            "distanceBetweenMagnetsInClip",
+            "distanceBetweenMagnetClipAndPolygonEdge",
+            "distanceBetweenMagnetClipAndSlot",
+            "foamThickness",
+            "mountDiameter",
+            "mountHeight",
+            "mountShellThickness",
+            "mountBottomAngleOpening",
+            "mountTopAngleOpening",
+            "brim",
+            "strapWidth",
+            "strapThickness",
+            "strapClipThickness",
+            "strapClipRadius",
+            "distanceBetweenStrapsInClip",
+            "strapClipRim",
+            "slotSpacing",
+        ]
+    )
+
     def __init__(self, userDir):
         super().__init__()
         self.userDir = userDir
@@ -161,37 +206,6 @@ class Generator(QRunnable):
     def validate(self):
         messages = []
         tolerance = 0.5
-        validatable = [
-            "concentricPolygonDiameter",
-            "tactorDiameter",
-            "numSides",
-            "slotWidth",
-            "slotHeight",
-            "slotBorderRadius",
-            "magnetDiameter",
-            "magnetThickness",
-            "magnetRingDiameter",
-            "numMagnetsInRing",
-            "magnetClipThickness",
-            "magnetClipRingThickness",
-            "distanceBetweenMagnetsInClip",
-            "distanceBetweenMagnetClipAndPolygonEdge",
-            "distanceBetweenMagnetClipAndSlot",
-            "foamThickness",
-            "mountDiameter",
-            "mountHeight",
-            "mountShellThickness",
-            "mountBottomAngleOpening",
-            "mountTopAngleOpening",
-            "brim",
-            "strapWidth",
-            "strapThickness",
-            "strapClipThickness",
-            "strapClipRadius",
-            "distanceBetweenStrapsInClip",
-            "strapClipRim",
-            "slotSpacing",
-        ]
 
         if self.numSides < 3 or self.numSides > 8:
             messages.append(
@@ -199,7 +213,7 @@ class Generator(QRunnable):
             )
 
         for attr, val in vars(self).items():
-            if attr in validatable and (val <= 0 or val == None):
+            if attr in self.VALIDATABLE_PARAMS and (val is None or val <= 0):
                 messages.append(f"{attr} must be some positive non-zero value")
 
         if self.tactorDiameter >= self.concentricPolygonDiameter:
@@ -417,7 +431,7 @@ class Generator(QRunnable):
                     setattr(self, attrName, parsed_val)
         except Exception as e:
             # Log the error but don't crash the application
-            print(f"Warning: Failed to set parameter {attrName} to '{val}': {e}")
+            logger.warning("Failed to set parameter %s to '%s': %s", attrName, val, e)
             # Keep the current value unchanged
             pass
 
@@ -26,15 +26,48 @@ class ValidationResult:
 class ValidationEngine:
     """Advanced validation with detailed feedback"""
 
+    # Parameters only checked on their own (range, wall thickness, assembly
+    # tolerance); the geometric constraints never read them
+    FAST_PARAMS = frozenset(
+        [
+            "foamThickness",
+            "magnetClipThickness",
+            "brim",
+            "strapWidth",
+            "strapThickness",
+            "strapClipThickness",
+            "distanceBetweenStrapsInClip",
+            "slotSpacing",
+        ]
+    )
+    GEOMETRIC_PARAMS = tuple(sorted(set(ConfigurationManager.PARAMETERS) - FAST_PARAMS))
+
     def __init__(self):
         self.tolerance = 1.0  # mm tolerance for manufacturing
         self.critical_errors = []
         self.warnings = []
         self.affected_params = set()
+        # (geometric input values, errors, affected params) of the last run
+        self._geometric_cache = None
 
     def validate_complete(self, config: Dict) -> ValidationResult:
         """Complete validation with all checks"""
-
+        return self._run_validation(config, reuse_geometric=False)
+
+    def validate_incremental(
+        self, changed_params: Set[str], config: Dict
+    ) -> ValidationResult:
+        """
+        Revalidate after edits to changed_params only.
+
+        When every changed parameter is in FAST_PARAMS and the geometric inputs
+        match the last run, the geometric stage is reused instead of recomputed;
+        otherwise this is equivalent to validate_complete.
+        """
+        reuse = set(changed_params) <= self.FAST_PARAMS
+        return self._run_validation(config, reuse_geometric=reuse)
+
+    def _run_validation(self, config: Dict, reuse_geometric: bool) -> ValidationResult:
         # Reset state
         self.critical_errors = []
         self.warnings = []
@@ -46,7 +79,7 @@ class ValidationEngine:
 
         # Run validation stages
         self._validate_basic_ranges(rounded_config)
-        self._validate_geometric_constraints(rounded_config)
+        self._validate_geometric_stage(rounded_config, reuse_geometric)
         self._validate_manufacturing_constraints(rounded_config)
         self._validate_assembly_constraints(rounded_config)
 
@@ -106,6 +139,24 @@ class ValidationEngine:
                     )
                     self.affected_params.add(param_name)
 
+    def _validate_geometric_stage(self, config: Dict, reuse: bool):
+        """Run (or reuse) the geometric constraints and merge their findings"""
+        key = tuple(config.get(name) for name in self.GEOMETRIC_PARAMS)
+        cache = self._geometric_cache
+        if not (reuse and cache is not None and cache[0] == key):
+            # Collect the geometric findings separately so they can be cached
+            errors, params = self.critical_errors, self.affected_params
+            self.critical_errors, self.affected_params = [], set()
+            try:
+                self._validate_geometric_constraints(config)
+                cache = (key, self.critical_errors, self.affected_params)
+                self._geometric_cache = cache
+            finally:
+                self.critical_errors, self.affected_params = errors, params
+
+        self.critical_errors.extend(cache[1])
+        self.affected_params.update(cache[2])
+
     def _validate_geometric_constraints(self, config: Dict):
         """Detailed geometric validation"""
         # Extract values with defaults
@@ -1,6 +1,5 @@
 import sys
 from PyQt5 import QtWidgets, QtCore
-from haptic_harness_generator.ui.main_window import MyMainWindow
 import os
 import argparse
 
@@ -79,6 +78,9 @@ def run_app():
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts, True)
 
+    # Imported here so --help and a failed environment check skip loading VTK
+    from haptic_harness_generator.ui.main_window import MyMainWindow
+
     app = QtWidgets.QApplication(sys.argv)
     window = MyMainWindow(userDir=export_dir)
     sys.exit(app.exec_())
@@ -9,8 +9,8 @@ This module contains all UI-related functionality including:
 
 from .main_window import MyMainWindow as MainWindow
 from .ui_helpers import (ParameterWidget, ValidationDisplay, ScalingHelper,
-                        PresetSelector, ParameterCategory)
+                        PresetSelector, ParameterCategory, LazyInteractorFrame)
 from .styles import Styles
 
 __all__ = ['MainWindow', 'ParameterWidget', 'ValidationDisplay', 'ScalingHelper',
-           'PresetSelector', 'ParameterCategory', 'Styles']
+           'PresetSelector', 'ParameterCategory', 'LazyInteractorFrame', 'Styles']
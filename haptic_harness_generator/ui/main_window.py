@@ -2,11 +2,10 @@ from pyvistaqt import QtInteractor, MainWindow
 from PyQt5 import QtCore, QtWidgets, Qt, QtGui
 from haptic_harness_generator.ui.styles import Styles
 from haptic_harness_generator.core.generator import Generator, WorkerWrapper
-from time import perf_counter
-import re
 import os
-from pyvista import Camera
-import numpy as np
+import math
+import functools
+import logging
 
 # Import new modular components
 from haptic_harness_generator.core.config_manager import ConfigurationManager
@@ -17,6 +16,7 @@ from haptic_harness_generator.ui.ui_helpers import (
     ScalingHelper,
     PresetSelector,
     ParameterCategory,
+    LazyInteractorFrame,
 )
 
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,9 +26,59 @@ anatomy_of_tile_path = os.path.join(current_dir, "assets", "hapticsNew.jpg")
 # Use ConfigurationManager for presets instead of hardcoded values
 PRESET_CONFIGS = ConfigurationManager.PRESETS
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _styles_bundle():
+    """Base stylesheet and interactor colors, assembled once per process"""
+    styles = Styles()
+    return styles.getStyles(), styles.colors["green"], styles.colors["lightGray"]
+
+
+def _stop_thread(thread):
+    """Quit a thread's event loop and wait for its current slot to return"""
+    try:
+        thread.quit()
+        thread.wait()
+    except RuntimeError:
+        # The underlying QThread was already deleted with its parent
+        pass
+
 
 class MyMainWindow(MainWindow):
 
+    # Parameters entered in degrees but stored on the generator in radians
+    ANGULAR_PARAMS = frozenset(["mountBottomAngleOpening", "mountTopAngleOpening"])
+    # Parameters the generator requires as integers
+    INTEGER_PARAMS = frozenset(["numSides", "numMagnetsInRing"])
+    # View title per plotter slot, in generator.generatedObjects order
+    PART_LABELS = (
+        "Tyvek Tile",
+        "Foam Liner",
+        "Magnetic Ring",
+        "Base",
+        "Bottom Clip",
+        "Magnet Clip",
+        "Mount",
+        "Strap Clip",
+    )
+    # Progress bar text for each step reported by Generator.signals.progress
+    PROGRESS_LABELS = {
+        1: "Generating tyvek tile",
+        2: "Generating foam",
+        3: "Generating magnet ring",
+        4: "Generating base",
+        5: "Generating bottom clip",
+        6: "Generating magnet clip",
+        7: "Generating mount",
+        8: "Generating strap clip",
+        9: "Generation complete",
+    }
+    _PROGRESS_SCALE = 100 / len(PROGRESS_LABELS)
+    # Extra add_mesh options for the flat tile parts (plotters 0-2)
+    TILE_MESH_KWARGS = {"show_edges": True, "line_width": 3}
+
     def __init__(self, userDir, parent=None, show=True):
         QtWidgets.QMainWindow.__init__(self, parent)
 
@@ -38,30 +88,40 @@ class MyMainWindow(MainWindow):
         self.validator = ValidationEngine()
         self.parameter_widgets = {}
         self.parameter_categories = {}
+        self._dirty_params = set()  # edited since the last validation
+        self._last_valid_config = None  # generator values that last passed validate()
 
         # Connect generator signals
         self.generator.signals.progress.connect(self.update_progress)
         self.generator.signals.finished.connect(self.task_finished)
-        self.threadpool = QtCore.QThreadPool()
+
+        # Persistent generation thread, triggered through a queued signal
+        self._gen_thread = QtCore.QThread(self)
+        self._gen_worker = WorkerWrapper(self.generator)
+        self._gen_worker.moveToThread(self._gen_thread)
+        self._gen_thread.finished.connect(self._gen_worker.deleteLater)
+        # Stopped with the window's lifetime, not on close, so a hidden or
+        # re-shown window keeps generating and Qt never destroys it running
+        stop_gen_thread = functools.partial(_stop_thread, self._gen_thread)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(stop_gen_thread)
+        self.destroyed.connect(stop_gen_thread)
+        self._gen_thread.start()
 
         # Setup validation timer for debounced auto-validation
         self.validation_timer = QtCore.QTimer()
         self.validation_timer.setSingleShot(True)
         self.validation_timer.timeout.connect(self.validate_configuration)
 
-        # Apply styling
-        styleSheet = Styles()
-        super().setStyleSheet(styleSheet.getStyles())
-        self.interactorColor = styleSheet.colors["green"]
-        self.grayColor = styleSheet.colors["lightGray"]
-
-        # Apply DPI-scaled styles
-        self.apply_scaled_styles()
+        # Apply base and DPI-scaled styling in a single stylesheet pass
+        base_styles, self.interactorColor, self.grayColor = _styles_bundle()
+        super().setStyleSheet(base_styles + self.get_scaled_styles())
 
         # Create main layout
         primaryLayout = Qt.QHBoxLayout()
         self.frame = QtWidgets.QFrame()
-        self.plotters = []
+        # One slot per generated object: 0-2 tile parts, 3-7 peripherals
+        self.plotters = [None] * len(self.generator.generatedObjects)
+        self._part_actors = [None] * len(self.plotters)  # mesh actor per plotter
 
         # Progress bar
         self.pbar = QtWidgets.QProgressBar(self)
@@ -86,13 +146,13 @@ class MyMainWindow(MainWindow):
         if show:
             self.show()
 
-    def apply_scaled_styles(self):
-        """Apply DPI-scaled styles"""
+    def get_scaled_styles(self):
+        """Build DPI-scaled styles to append to the base stylesheet"""
         scale = ScalingHelper.get_scale_factor()
         base_font = ScalingHelper.scale_font(14)
 
         # Additional styling for modular components
-        style = f"""
+        return f"""
             QWidget {{
                 font-size: {base_font}px;
             }}
@@ -104,9 +164,6 @@ class MyMainWindow(MainWindow):
                 padding: {int(3*scale)}px;
             }}
         """
-        # Apply additional styles without overriding existing ones
-        current_style = self.styleSheet()
-        self.setStyleSheet(current_style + style)
 
     def objectsPane(self):
         scroll_area = QtWidgets.QScrollArea()
@@ -114,13 +171,10 @@ class MyMainWindow(MainWindow):
 
         vbox = QtWidgets.QVBoxLayout()
         vbox.addWidget(self.pbar)
+        # Peripheral cameras are snapshotted as each interactor initializes
+        self.settings = [None] * 5
         vbox.addWidget(self.initTilePane())
         vbox.addWidget(self.initPeripheralsPane())
-        self.settings = []
-        for pl in self.plotters[:3]:
-            pl.camera_position = "yx"
-        for pl in self.plotters[3:]:
-            self.settings.append(pl.camera.copy())
         reset_view = QtWidgets.QPushButton("Reset View")
         reset_view.clicked.connect(self.reset_view)
         vbox.addWidget(reset_view)
@@ -163,8 +217,6 @@ class MyMainWindow(MainWindow):
         scroll_area = QtWidgets.QScrollArea()
 
         label = QtWidgets.QLabel(self)
-        pixmap = QtGui.QPixmap(anatomy_of_tile_path)
-        pixmap.setDevicePixelRatio(2.0)
 
         # Use parameter panel width for scaling, with fallback to reasonable default
         try:
@@ -178,9 +230,21 @@ class MyMainWindow(MainWindow):
         except (AttributeError, TypeError):
             target_width = 600  # Fallback default
 
-        scaled_pixmap = pixmap.scaledToWidth(
-            int(target_width), mode=QtCore.Qt.SmoothTransformation
-        )
+        # Decode and smooth-scale the large diagram only once per width
+        cache_key = f"anatomy_{int(target_width)}"
+        scaled_pixmap = QtGui.QPixmapCache.find(cache_key)
+        if scaled_pixmap is None:
+            # Let the JPEG decoder scale while decoding instead of scaling the
+            # full-resolution image afterwards
+            reader = QtGui.QImageReader(anatomy_of_tile_path)
+            source_size = reader.size()
+            width = int(target_width)
+            height = round(source_size.height() * width / source_size.width())
+            reader.setScaledSize(QtCore.QSize(width, height))
+            image = reader.read()
+            image.setDevicePixelRatio(2.0)
+            scaled_pixmap = QtGui.QPixmap.fromImage(image)
+            QtGui.QPixmapCache.insert(cache_key, scaled_pixmap)
         label.setPixmap(scaled_pixmap)
 
         scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
@@ -412,6 +476,7 @@ class MyMainWindow(MainWindow):
     def on_parameter_changed(self, param_name, value):
         """Handle parameter value changes with robust error handling"""
         try:
+            self._dirty_params.add(param_name)
             self.setGeneratorAttribute(param_name, value)
             # Only switch to custom if this is a user edit, not programmatic update
             if not self.parameter_widgets[param_name]._updating_programmatically:
@@ -421,8 +486,11 @@ class MyMainWindow(MainWindow):
                 self.validation_timer.start(500)
         except Exception as e:
             # Log the error but don't crash the application
-            print(
-                f"Warning: Failed to update parameter {param_name} with value '{value}': {e}"
+            logger.warning(
+                "Failed to update parameter %s with value '%s': %s",
+                param_name,
+                value,
+                e,
             )
             # The parameter widget will handle visual feedback
             pass
@@ -436,27 +504,34 @@ class MyMainWindow(MainWindow):
             for category_widget in self.parameter_categories.values():
                 category_widget.set_values(config)
 
-            # Apply to generator
-            for param_name, value in config.items():
-                if hasattr(self.generator, param_name):
-                    # Handle angle conversions
-                    if param_name in [
-                        "mountBottomAngleOpening",
-                        "mountTopAngleOpening",
-                    ]:
-                        value = value * np.pi / 180  # Convert to radians
-                    # Ensure integer parameters are actually integers
-                    elif param_name in ["numSides", "numMagnetsInRing"]:
-                        value = int(value)
-                    setattr(self.generator, param_name, value)
+            # Apply to generator in one update
+            self.apply_config_to_generator(config)
 
             # Update display
             self.grayOutPlotters()
             self.pbar.setValue(0)
             self.pbar.setFormat("Preset Loaded - Ready to Generate")
 
-            # Auto-validate
-            self.validate_configuration()
+            # Auto-validate once, coalescing with any pending debounced run
+            self.validation_timer.start(0)
+
+    def apply_config_to_generator(self, config):
+        """Convert a UI configuration to generator units and apply it in bulk"""
+        generator_attrs = vars(self.generator)
+        angular, integer = self.ANGULAR_PARAMS, self.INTEGER_PARAMS
+        radians = math.radians
+        translated = {}
+        for param_name, value in config.items():
+            if param_name in generator_attrs:
+                # Handle angle conversions
+                if param_name in angular:
+                    value = radians(value)
+                # Ensure integer parameters are actually integers
+                elif param_name in integer:
+                    value = int(value)
+                translated[param_name] = value
+        # Generator parameters are plain attributes, so no setters are bypassed
+        generator_attrs.update(translated)
 
     def validate_configuration(self):
         """Validate current configuration with enhanced visual feedback"""
@@ -465,15 +540,17 @@ class MyMainWindow(MainWindow):
         for category_widget in self.parameter_categories.values():
             config.update(category_widget.get_values())
 
-        # Validate using the validation engine
-        result = self.validator.validate_complete(config)
+        # Validate using the validation engine, rechecking only what was edited
+        result = self.validator.validate_incremental(self._dirty_params, config)
+        self._dirty_params.clear()
 
         # Update validation display
         self.validation_display.update_validation(result)
 
         # Highlight error fields
+        affected = result.affected_parameters
         for param_name, widget in self.parameter_widgets.items():
-            widget.set_error(param_name in result.affected_parameters)
+            widget.set_error(param_name in affected)
 
         # Enable/disable generate button with visual feedback
         self.generate_btn.setEnabled(result.is_valid)
@@ -533,7 +610,7 @@ class MyMainWindow(MainWindow):
                 )
         except Exception as e:
             # Log error but don't stop generation
-            print(f"Auto-save error: {e}")
+            logger.warning("Auto-save error: %s", e)
             QtWidgets.QMessageBox.warning(
                 self,
                 "Auto-save Warning",
@@ -545,46 +622,71 @@ class MyMainWindow(MainWindow):
 
     def initTilePane(self):
         interactors_layout = QtWidgets.QHBoxLayout()
-        labels = ["Tyvek Tile", "Foam Liner", "Magnetic Ring"]
         for i in range(3):
             section = QtWidgets.QVBoxLayout()
-            interactor = QtInteractor(self.frame)
-            interactor.disable()
-            interactor.interactor.setMinimumHeight(200)
-            self.plotters.append(interactor)
-            label = QtWidgets.QLabel(labels[i], objectName="sectionHeader")
+            plotter_frame = self._create_plotter_slot(i)
+            plotter_frame.setMinimumHeight(200)
+            label = QtWidgets.QLabel(
+                self.PART_LABELS[i], objectName="sectionHeader"
+            )
             label.setAlignment(QtCore.Qt.AlignCenter)
             section.addWidget(label)
-            section.addWidget(self.plotters[i].interactor)
+            section.addWidget(plotter_frame)
             frame = Qt.QFrame(objectName="sectionFrame")
             frame.setFrameShape(Qt.QFrame.StyledPanel)
             frame.setLayout(section)
             interactors_layout.addWidget(frame)
 
-        self.plotters[0].add_mesh(
-            self.generator.tyvek_tile,
-            show_edges=True,
-            line_width=3,
-            color=self.interactorColor,
-        )
-        self.plotters[1].add_mesh(
-            self.generator.foam,
-            show_edges=True,
-            line_width=3,
-            color=self.interactorColor,
-        )
-        self.plotters[2].add_mesh(
-            self.generator.magnet_ring,
-            show_edges=True,
-            line_width=3,
-            color=self.interactorColor,
-        )
-
         frame = Qt.QFrame(objectName="sectionFrame")
         frame.setFrameShape(Qt.QFrame.StyledPanel)
         frame.setLayout(interactors_layout)
         return frame
 
+    def _create_plotter_slot(self, idx):
+        """Frame for plotter slot idx; its interactor is built on first show"""
+        return LazyInteractorFrame(lambda: self._init_plotter(idx))
+
+    def _init_plotter(self, idx):
+        """Create the interactor for slot idx and show its current mesh"""
+        interactor = QtInteractor(self.frame)
+        self._part_actors[idx] = self._add_part_mesh(
+            interactor, idx, self.interactorColor
+        )
+        if idx < 3:
+            # 2D tile components
+            interactor.disable()
+            interactor.camera_position = "yx"
+        else:
+            # 3D peripherals
+            # Add rotation hint text instead of logo (PyVista 0.42.3 compatible)
+            interactor.add_text(
+                "↻ Drag to rotate", position="lower_left", font_size=8, color="gray"
+            )
+            # Keep the default view as a plain tuple instead of a vtkCamera copy
+            camera = interactor.camera
+            self.settings[idx - 3] = (camera.position, camera.focal_point, camera.up)
+        self.plotters[idx] = interactor
+        return interactor.interactor
+
+    def _add_part_mesh(self, plotter, idx, color, **kwargs):
+        """Add generated object idx to plotter, with edges for the tile parts
+
+        Nothing is rendered here; callers render once after their batch.
+        """
+        if idx < 3:
+            kwargs.update(self.TILE_MESH_KWARGS)
+        kwargs.setdefault("render", False)
+        return plotter.add_mesh(
+            self.generator.generatedObjects[idx], color=color, **kwargs
+        )
+
+    def _update_part_mesh(self, idx, color, opacity=1.0):
+        """Swap slot idx's current generated object into its existing actor"""
+        actor = self._part_actors[idx]
+        actor.mapper.SetInputData(self.generator.generatedObjects[idx])
+        actor.prop.color = color
+        actor.prop.opacity = opacity
+
     def reset_view(self):
         # 2D tile components
         centers = [
@@ -593,52 +695,52 @@ class MyMainWindow(MainWindow):
             self.generator.magnet_ring.center,
         ]
         bounds = self.generator.tyvek_tile.bounds
+        max_extent = max(
+            bounds[1] - bounds[0], bounds[3] - bounds[2], bounds[5] - bounds[4]
+        )
+        distance = max_extent * 2.5
         for i in range(3):
-            self.plotters[i].camera.focal_point = centers[i]
-            max_extent = max(
-                bounds[1] - bounds[0], bounds[3] - bounds[2], bounds[5] - bounds[4]
-            )
-            distance = max_extent * 2.5
-            self.plotters[i].camera.position = (
-                centers[i][0],
-                centers[i][1],
-                centers[i][2] + distance,
-            )
+            if self.plotters[i] is None:
+                continue
+            camera = self.plotters[i].camera
+            center = centers[i]
+            camera.focal_point = center
+            camera.position = (center[0], center[1], center[2] + distance)
         # 3D peripherals
         for i in range(5):
-            self.plotters[i + 3].camera = self.settings[i].copy()
+            if self.plotters[i + 3] is not None:
+                self.plotters[i + 3].camera_position = self.settings[i]
+        self._render_plotters()
+
+    def _render_plotters(self):
+        """Render each built plotter once after a batch of scene changes"""
+        for pl in self.plotters:
+            if pl is not None:
+                pl.render()
 
     def initPeripheralsPane(self):
 
         plotLayout = Qt.QVBoxLayout()
         subPlotLayout = Qt.QHBoxLayout()
 
-        labels = ["Base", "Bottom Clip", "Magnet Clip", "Mount", "Strap Clip"]
-
         for i in range(2):
             subPlotLayout = Qt.QHBoxLayout()
             for j in range(3):
                 if (i * 3 + j) == 5:
                     continue
+                idx = 3 + i * 3 + j
                 section = QtWidgets.QVBoxLayout()
-                interactor = QtInteractor(self.frame)
-                self.plotters.append(interactor)
-                label = QtWidgets.QLabel(labels[i * 3 + j], objectName="sectionHeader")
+                plotter_frame = self._create_plotter_slot(idx)
+                label = QtWidgets.QLabel(
+                    self.PART_LABELS[idx], objectName="sectionHeader"
+                )
                 label.setAlignment(QtCore.Qt.AlignCenter)
                 section.addWidget(label)
-                section.addWidget(self.plotters[-1].interactor)
+                section.addWidget(plotter_frame)
                 frame = Qt.QFrame(objectName="sectionFrame")
                 frame.setFrameShape(Qt.QFrame.StyledPanel)
                 frame.setLayout(section)
                 subPlotLayout.addWidget(frame)
-                self.plotters[-1].add_mesh(
-                    self.generator.generatedObjects[i * 3 + j + 3],
-                    color=self.interactorColor,
-                )
-                # Add rotation hint text instead of logo (PyVista 0.42.3 compatible)
-                self.plotters[-1].add_text(
-                    "↻ Drag to rotate", position="lower_left", font_size=8, color="gray"
-                )
             plotLayout.addLayout(subPlotLayout)
 
         frame = Qt.QFrame(objectName="sectionFrame")
@@ -656,8 +758,8 @@ class MyMainWindow(MainWindow):
             self.pbar.setFormat("Ready to Generate")
         except Exception as e:
             # Log the error but don't crash the application
-            print(
-                f"Warning: Failed to set generator attribute {attrName} to '{val}': {e}"
+            logger.warning(
+                "Failed to set generator attribute %s to '%s': %s", attrName, val, e
             )
             # Keep the UI in a consistent state
             self.pbar.setFormat("Parameter Error - Check Input")
@@ -665,23 +767,13 @@ class MyMainWindow(MainWindow):
             pass
 
     def grayOutPlotters(self):
+        # Only the look changes; the meshes stay until the next generation
         opacity = 0.7
-        for i, pl in enumerate(self.plotters[:3]):
-            pl.clear_actors()
-            pl.add_mesh(
-                self.generator.generatedObjects[i],
-                show_edges=True,
-                line_width=3,
-                opacity=opacity,
-                color=self.grayColor,
-            )
-        for i, pl in enumerate(self.plotters[3:]):
-            pl.clear_actors()
-            pl.add_mesh(
-                self.generator.generatedObjects[i + 3],
-                opacity=opacity,
-                color=self.grayColor,
-            )
+        for actor in self._part_actors:
+            if actor is not None:
+                actor.prop.color = self.grayColor
+                actor.prop.opacity = opacity
+        self._render_plotters()
 
     def setDataValidation(self, state):
         if not self.dataValidationCheckBox.isChecked():
@@ -701,45 +793,33 @@ class MyMainWindow(MainWindow):
                 self.dataValidationCheckBox.setChecked(True)
 
     def update_progress(self, value):
-        progress_labels = {
-            1: "Generating tyvek tile",
-            2: "Generating foam",
-            3: "Generating magnet ring",
-            4: "Generating base",
-            5: "Generating bottom clip",
-            6: "Generating magnet clip",
-            7: "Generating mount",
-            8: "Generating strap clip",
-            9: "Generation complete",
-        }
-        self.pbar.setValue(value / len(progress_labels) * 100)
-        self.pbar.setFormat(progress_labels[value])
+        self.pbar.setValue(int(value * self._PROGRESS_SCALE))
+        self.pbar.setFormat(self.PROGRESS_LABELS[value])
 
     def task_finished(self):
         self.generate_btn.setEnabled(True)
-        for i, pl in enumerate(self.plotters[:3]):
-            pl.clear_actors()
-            pl.add_mesh(
-                self.generator.generatedObjects[i],
-                show_edges=True,
-                line_width=3,
-                color=self.interactorColor,
-            )
-        for i, pl in enumerate(self.plotters[3:]):
-            pl.clear_actors()
-            pl.add_mesh(
-                self.generator.generatedObjects[i + 3], color=self.interactorColor
-            )
+        for i, pl in enumerate(self.plotters):
+            if pl is not None:
+                self._update_part_mesh(i, self.interactorColor)
 
+        # Renders every plotter once, with the new meshes and cameras in place
         self.reset_view()
 
     def regen(self):
         messages = []
         if self.dataValidationCheckBox.isChecked():
-            messages = self.generator.validate()
+            # Skip the checks if these exact parameters already passed them
+            config_key = tuple(
+                getattr(self.generator, name, None)
+                for name in ConfigurationManager.PARAMETERS
+            )
+            if config_key != self._last_valid_config:
+                messages = self.generator.validate()
+                if len(messages) == 0:
+                    self._last_valid_config = config_key
         if len(messages) == 0:
             self.generate_btn.setEnabled(False)
-            self.threadpool.start(WorkerWrapper(self.generator))
+            self._gen_worker.run_requested.emit()
         else:
             msg = QtWidgets.QMessageBox()
             msg.setIcon(QtWidgets.QMessageBox.Critical)
@@ -761,23 +841,21 @@ class MyMainWindow(MainWindow):
             config.update(category_widget.get_values())
 
         # Handle angle conversions for export (convert radians to degrees)
-        for param_name in ["mountBottomAngleOpening", "mountTopAngleOpening"]:
+        for param_name in self.ANGULAR_PARAMS:
             if param_name in config:
                 # Get the actual value from generator (which is in radians)
                 generator_value = getattr(self.generator, param_name, 0)
-                config[param_name] = generator_value * 180 / np.pi
+                config[param_name] = math.degrees(generator_value)
 
         return config
 
     def export_configuration(self):
         """Export current configuration using ConfigurationManager"""
-        from PyQt5.QtWidgets import QFileDialog
-
         # Use the helper method to get current configuration
         config = self.get_current_configuration()
 
         # Get filename from user
-        filename, _ = QFileDialog.getSaveFileName(
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Export Configuration",
             f"{self.userDir}/config.json",
@@ -800,9 +878,7 @@ class MyMainWindow(MainWindow):
 
     def import_configuration(self):
         """Import configuration using ConfigurationManager"""
-        from PyQt5.QtWidgets import QFileDialog
-
-        filename, _ = QFileDialog.getOpenFileName(
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Import Configuration", self.userDir, "JSON Files (*.json)"
         )
 
@@ -814,19 +890,8 @@ class MyMainWindow(MainWindow):
                 for category_widget in self.parameter_categories.values():
                     category_widget.set_values(config)
 
-                # Apply to generator
-                for param_name, value in config.items():
-                    if hasattr(self.generator, param_name):
-                        # Handle angle conversions
-                        if param_name in [
-                            "mountBottomAngleOpening",
-                            "mountTopAngleOpening",
-                        ]:
-                            value = value * np.pi / 180  # Convert to radians
-                        # Ensure integer parameters are always integers
-                        elif param_name in ["numSides", "numMagnetsInRing"]:
-                            value = int(value)
-                        setattr(self.generator, param_name, value)
+                # Apply to generator in one update
+                self.apply_config_to_generator(config)
 
                 # Update UI
                 self.grayOutPlotters()
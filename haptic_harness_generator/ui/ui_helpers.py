@@ -16,6 +16,33 @@ class ParameterWidget(QtWidgets.QWidget):
 
     parameterChanged = QtCore.pyqtSignal(str, str)  # name, value
 
+    # Input styles applied by set_error
+    ERROR_STYLE = """
+        QLineEdit {
+            border: 2px solid #ff4444;
+            background-color: #552222;
+            color: #ffaaaa;
+        }
+    """
+    # Normal state with hover effects
+    NORMAL_STYLE = """
+        QLineEdit {
+            border: 1px solid #3a3a4a;
+            background-color: #2a2a2a;
+            color: #ffffff;
+            padding: 3px;
+            border-radius: 3px;
+        }
+        QLineEdit:hover {
+            border-color: #4a4a5a;
+            background-color: #3a3a3a;
+        }
+        QLineEdit:focus {
+            border-color: #5a5a6a;
+            background-color: #3a3a3a;
+        }
+    """
+
     def __init__(self, param_def, parent=None):
         super().__init__(parent)
         self.param_def = param_def
@@ -267,37 +294,10 @@ class ParameterWidget(QtWidgets.QWidget):
 
     def set_error(self, has_error):
         """Highlight field if it has an error with enhanced visual states"""
-        if has_error:
-            self.input.setStyleSheet(
-                """
-                QLineEdit {
-                    border: 2px solid #ff4444;
-                    background-color: #552222;
-                    color: #ffaaaa;
-                }
-            """
-            )
-        else:
-            # Normal state with hover effects
-            self.input.setStyleSheet(
-                """
-                QLineEdit {
-                    border: 1px solid #3a3a4a;
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    padding: 3px;
-                    border-radius: 3px;
-                }
-                QLineEdit:hover {
-                    border-color: #4a4a5a;
-                    background-color: #3a3a3a;
-                }
-                QLineEdit:focus {
-                    border-color: #5a5a6a;
-                    background-color: #3a3a3a;
-                }
-            """
-            )
+        style = self.ERROR_STYLE if has_error else self.NORMAL_STYLE
+        # Setting a stylesheet repolishes the widget even when it is unchanged
+        if self.input.styleSheet() != style:
+            self.input.setStyleSheet(style)
 
 
 class ValidationDisplay(QtWidgets.QWidget):
@@ -707,3 +707,29 @@ class ParameterCategory(QtWidgets.QWidget):
                 except ValueError:
                     pass  # Skip invalid values
         return values
+
+
+class LazyInteractorFrame(QtWidgets.QStackedWidget):
+    """Placeholder that builds its 3D interactor the first time it is shown"""
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self._factory = factory  # zero-arg callable returning the interactor widget
+        self.is_initialized = False
+
+        placeholder = QtWidgets.QLabel("Loading 3D view...")
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        placeholder.setStyleSheet("color: #888888; font-style: italic;")
+        self.addWidget(placeholder)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.is_initialized:
+            self.is_initialized = True
+            # Build after the event loop has painted the placeholder
+            QtCore.QTimer.singleShot(0, self._build_interactor)
+
+    def _build_interactor(self):
+        self.addWidget(self._factory())
+        self.setCurrentIndex(1)
+        self._factory = None
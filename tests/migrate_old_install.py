@@ -22,12 +22,7 @@ def check_pypi_installation():
     """Check if haptic-harness-generator is installed via pip"""
     print("Checking for PyPI installation...")
     
-    result = run_command("pip list | grep haptic-harness-generator")
-    if result and result.returncode == 0 and result.stdout.strip():
-        print("⚠️  Found PyPI installation of haptic-harness-generator")
-        return True
-    
-    # Also check with pip show
+    # A single pip show covers what the former `pip list | grep` pipeline found
     result = run_command("pip show haptic-harness-generator")
     if result and result.returncode == 0:
         print("⚠️  Found PyPI installation of haptic-harness-generator")
@@ -87,9 +82,10 @@ def detect_installation_issues():
     issues = []
     
     # Check for multiple Python environments
-    result = run_command("conda env list | grep hhgen")
+    # Filter the listing in-process rather than piping it through grep
+    result = run_command("conda env list")
     if result and result.returncode == 0:
-        env_count = len([line for line in result.stdout.split('\n') if 'hhgen' in line])
+        env_count = sum('hhgen' in line for line in result.stdout.splitlines())
         if env_count > 1:
             issues.append("Multiple hhgen environments detected")
     
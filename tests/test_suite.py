@@ -40,10 +40,12 @@ class TestPresetConfigurations(unittest.TestCase):
         except ImportError:
             self.skipTest("Generator module not available for testing")
 
+        # Generator() already builds every mesh, so construct it once and
+        # only regenerate per preset (every preset sets all parameters)
+        generator = Generator(self.test_dir)
+
         for preset_name, config in ConfigurationManager.PRESETS.items():
             with self.subTest(preset=preset_name):
-                generator = Generator(self.test_dir)
-
                 # Apply configuration
                 for param, value in config.items():
                     if param in ["mountBottomAngleOpening", "mountTopAngleOpening"]:
@@ -252,6 +254,25 @@ class TestParameterInteractions(unittest.TestCase):
                 # Should never crash
                 self.assertIsNotNone(result)
 
+    def test_incremental_matches_complete(self):
+        """Incremental validation must agree with a complete validation"""
+        self.validator.validate_complete(self.base_config)
+
+        for param in ConfigurationManager.PARAMETERS:
+            with self.subTest(parameter=param):
+                config = self.base_config.copy()
+                config[param] = 0.1  # Below every minimum
+
+                expected = ValidationEngine().validate_complete(config)
+                result = self.validator.validate_incremental({param}, config)
+
+                self.assertEqual(result.is_valid, expected.is_valid)
+                self.assertEqual(result.errors, expected.errors)
+                self.assertEqual(result.warnings, expected.warnings)
+                self.assertEqual(
+                    result.affected_parameters, expected.affected_parameters
+                )
+
     def test_suggestion_generation(self):
         """Test that validation suggestions are generated"""
         config = self.base_config.copy()